@@ -1,9 +1,10 @@
 """A collection of CLI commands for working with Kedro pipelines."""
+import os
 import re
 import shutil
 from pathlib import Path
 from textwrap import indent
-from typing import List, NamedTuple, Tuple
+from typing import Iterator, List, NamedTuple, Tuple
 
 import click
 
@@ -31,6 +32,14 @@ setup(
 )
 """
 
+_PKG_NAME_OK = re.compile(r"[a-zA-Z_]\w+\Z")
+_PKG_NAME_HEAD = re.compile(r"[a-zA-Z_]")
+_PKG_NAME_BODY = re.compile(r"\w+\Z")
+
+_PIPELINE_TEMPLATE_PATH = Path(kedro.__file__).parent / "templates" / "pipeline"
+
+_cookiecutter = None  # pylint: disable=invalid-name
+
 
 class PipelineArtifacts(NamedTuple):
     """An ordered collection of source_path, tests_path, config_paths"""
@@ -49,15 +58,17 @@ def _assert_pkg_name_ok(pkg_name: str):
     Raises:
         KedroCliError: If package name violates the requirements.
     """
+    if _PKG_NAME_OK.match(pkg_name):
+        return
 
     base_message = f"'{pkg_name}' is not a valid Python package name."
-    if not re.match(r"^[a-zA-Z_]", pkg_name):
+    if not _PKG_NAME_HEAD.match(pkg_name):
         message = base_message + " It must start with a letter or underscore."
         raise KedroCliError(message)
     if len(pkg_name) < 2:
         message = base_message + " It must be at least 2 characters long."
         raise KedroCliError(message)
-    if not re.match(r"^\w+$", pkg_name[1:]):
+    if not _PKG_NAME_BODY.match(pkg_name, 1):
         message = (
             base_message + " It must contain only letters, digits, and/or underscores."
         )
@@ -143,11 +154,11 @@ def delete_pipeline(
 
     pipeline_artifacts = _get_pipeline_artifacts(metadata, pipeline_name=name, env=env)
 
-    files_to_delete = [
+    conf_files = (
         pipeline_artifacts.pipeline_conf / confdir / f"{name}.yml"
         for confdir in ("parameters", "catalog")
-        if (pipeline_artifacts.pipeline_conf / confdir / f"{name}.yml").is_file()
-    ]
+    )
+    files_to_delete = [path for path in conf_files if path.is_file()]
     dirs_to_delete = [
         path
         for path in (pipeline_artifacts.pipeline_dir, pipeline_artifacts.pipeline_tests)
@@ -191,19 +202,27 @@ def _echo_deletion_warning(message: str, **paths: List[Path]):
         click.echo(indent(paths_str, " " * 2))
 
 
-def _create_pipeline(name: str, output_dir: Path) -> Path:
-    with _filter_deprecation_warnings():
-        # pylint: disable=import-outside-toplevel
-        from cookiecutter.main import cookiecutter
+def _get_cookiecutter():
+    """Import ``cookiecutter`` on first use and return the cached function."""
+    global _cookiecutter  # pylint: disable=global-statement,invalid-name
+    if _cookiecutter is None:
+        with _filter_deprecation_warnings():
+            # pylint: disable=import-outside-toplevel
+            from cookiecutter.main import cookiecutter
+
+        _cookiecutter = cookiecutter
+    return _cookiecutter
 
-    template_path = Path(kedro.__file__).parent / "templates" / "pipeline"
+
+def _create_pipeline(name: str, output_dir: Path) -> Path:
+    cookiecutter = _get_cookiecutter()
     cookie_context = {"pipeline_name": name, "kedro_version": kedro.__version__}
 
     click.echo(f"Creating the pipeline '{name}': ", nl=False)
 
     try:
         result_path = cookiecutter(
-            str(template_path),
+            str(_PIPELINE_TEMPLATE_PATH),
             output_dir=str(output_dir),
             no_input=True,
             extra_context=cookie_context,
@@ -223,6 +242,48 @@ def _create_pipeline(name: str, output_dir: Path) -> Path:
     return result_path
 
 
+def _scan_sync_dirs(
+    source: Path, target: Path, overwrite: bool
+) -> Iterator[Tuple[Path, bool, bool]]:
+    """Lists the entries of `source` to be copied into `target` as
+    ``(source_path, is_file, skip)`` tuples, where `skip` tells whether
+    the entry clashes with an existing one in `target` (rule #1 of ``_sync_dirs``).
+    ``os.scandir`` entries cache the file type, so no extra ``stat()`` calls
+    are needed to tell files and directories apart.
+    """
+    existing_files, existing_folders = set(), set()
+    try:
+        with os.scandir(target) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    existing_files.add(entry.name)
+                elif entry.is_dir():
+                    existing_folders.add(entry.name)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+
+    try:
+        with os.scandir(source) as entries:
+            content = [(Path(entry.path), entry.is_file()) for entry in entries]
+    except NotADirectoryError:
+        content = [(source, True)]
+    except FileNotFoundError:  # pragma: no cover
+        # nothing to copy
+        content = []
+
+    return (
+        (
+            source_path,
+            is_file,
+            not overwrite
+            and source_path.name in existing_files
+            or is_file
+            and source_path.name in existing_folders,
+        )
+        for source_path, is_file in content
+    )
+
+
 # pylint: disable=missing-raises-doc
 def _sync_dirs(source: Path, target: Path, prefix: str = "", overwrite: bool = False):
     """Recursively copies `source` directory (or file) into `target` directory without
@@ -238,43 +299,57 @@ def _sync_dirs(source: Path, target: Path, prefix: str = "", overwrite: bool = F
         target: A local directory to copy to, will be created if doesn't exist yet.
         prefix: Prefix for CLI message indentation.
     """
+    # Directories are traversed depth-first using an explicit stack of partially
+    # consumed listings, which keeps the output order of a recursive traversal.
+    stack = [(_scan_sync_dirs(source, target, overwrite), target, prefix)]
+
+    while stack:
+        content, target, prefix = stack[-1]
+        for source_path, is_file, skip in content:
+            target_path = target / source_path.name
+            click.echo(indent(f"Creating '{target_path}': ", prefix), nl=False)
+
+            if skip:  # rule #1
+                click.secho("SKIPPED (already exists)", fg="yellow")
+            elif is_file:  # rule #2
+                try:
+                    target.mkdir(exist_ok=True, parents=True)
+                    shutil.copyfile(str(source_path), str(target_path))
+                except Exception:
+                    click.secho("FAILED", fg="red")
+                    raise
+                click.secho("OK", fg="green")
+            else:  # source_path is a directory, rule #3
+                click.echo()
+                new_prefix = (prefix or "") + " " * 2
+                sub_content = _scan_sync_dirs(source_path, target_path, False)
+                stack.append((sub_content, target_path, new_prefix))
+                break
+        else:
+            stack.pop()
 
-    existing = list(target.iterdir()) if target.is_dir() else []
-    existing_files = {f.name for f in existing if f.is_file()}
-    existing_folders = {f.name for f in existing if f.is_dir()}
 
-    if source.is_dir():
-        content = list(source.iterdir())
-    elif source.is_file():
-        content = [source]
+def _remove_tree(path: Path):
+    """Removes `path` directory together with all its contents. Symlinks are
+    removed without being followed, including `path` itself. Paths which no
+    longer exist are ignored.
+    """
+    if path.is_symlink():
+        _unlink_missing_ok(path)
     else:
-        # nothing to copy
-        content = []  # pragma: no cover
+        shutil.rmtree(str(path), onerror=_ignore_missing)
 
-    for source_path in content:
-        source_name = source_path.name
-        target_path = target / source_name
-        click.echo(indent(f"Creating '{target_path}': ", prefix), nl=False)
 
-        if (  # rule #1
-            not overwrite
-            and source_name in existing_files
-            or source_path.is_file()
-            and source_name in existing_folders
-        ):
-            click.secho("SKIPPED (already exists)", fg="yellow")
-        elif source_path.is_file():  # rule #2
-            try:
-                target.mkdir(exist_ok=True, parents=True)
-                shutil.copyfile(str(source_path), str(target_path))
-            except Exception:
-                click.secho("FAILED", fg="red")
-                raise
-            click.secho("OK", fg="green")
-        else:  # source_path is a directory, rule #3
-            click.echo()
-            new_prefix = (prefix or "") + " " * 2
-            _sync_dirs(source_path, target_path, prefix=new_prefix)
+def _ignore_missing(func, path, exc_info):  # pylint: disable=unused-argument
+    if not issubclass(exc_info[0], FileNotFoundError):
+        raise exc_info[1]
+
+
+def _unlink_missing_ok(path: Path):
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
 
 
 def _get_pipeline_artifacts(
@@ -290,11 +365,12 @@ def _get_artifacts_to_package(
     project_metadata: ProjectMetadata, module_path: str, env: str
 ) -> Tuple[Path, Path, Path]:
     """From existing project, returns in order: source_path, tests_path, config_paths"""
+    parts = module_path.split(".")
     package_dir = project_metadata.source_dir / project_metadata.package_name
     project_conf_path = project_metadata.project_path / settings.CONF_SOURCE
     artifacts = (
-        Path(package_dir, *module_path.split(".")),
-        Path(package_dir.parent, "tests", *module_path.split(".")),
+        package_dir.joinpath(*parts),
+        package_dir.parent.joinpath("tests", *parts),
         project_conf_path / env,
     )
     return artifacts
@@ -306,7 +382,7 @@ def _copy_pipeline_tests(pipeline_name: str, result_path: Path, package_dir: Pat
     try:
         _sync_dirs(tests_source, tests_target)
     finally:
-        shutil.rmtree(tests_source)
+        _remove_tree(tests_source)
 
 
 def _copy_pipeline_configs(
@@ -318,7 +394,7 @@ def _copy_pipeline_configs(
             config_target = conf_path / env
             _sync_dirs(config_source, config_target)
     finally:
-        shutil.rmtree(config_source)
+        _remove_tree(config_source)
 
 
 def _delete_artifacts(*artifacts: Path):
@@ -326,7 +402,7 @@ def _delete_artifacts(*artifacts: Path):
         click.echo(f"Deleting '{artifact}': ", nl=False)
         try:
             if artifact.is_dir():
-                shutil.rmtree(artifact)
+                _remove_tree(artifact)
             else:
                 artifact.unlink()
         except Exception as exc:
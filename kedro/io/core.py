@@ -180,7 +180,7 @@ class AbstractDataSet(abc.ABC, Generic[_DI, _DO]):
 
         """
 
-        self._logger.debug("Loading %s", str(self))
+        self._logger.debug("Loading %s", self)
 
         try:
             return self._load()
@@ -210,7 +210,7 @@ class AbstractDataSet(abc.ABC, Generic[_DI, _DO]):
             raise DataSetError("Saving 'None' to a 'DataSet' is not allowed")
 
         try:
-            self._logger.debug("Saving %s", str(self))
+            self._logger.debug("Saving %s", self)
             self._save(data)
         except DataSetError:
             raise
@@ -280,7 +280,7 @@ class AbstractDataSet(abc.ABC, Generic[_DI, _DO]):
 
         """
         try:
-            self._logger.debug("Checking whether target of %s exists", str(self))
+            self._logger.debug("Checking whether target of %s exists", self)
             return self._exists()
         except Exception as exc:
             message = (
@@ -303,7 +303,7 @@ class AbstractDataSet(abc.ABC, Generic[_DI, _DO]):
 
         """
         try:
-            self._logger.debug("Releasing %s", str(self))
+            self._logger.debug("Releasing %s", self)
             self._release()
         except Exception as exc:
             message = f"Failed during release for data set {str(self)}.\n{str(exc)}"
@@ -635,7 +635,7 @@ class AbstractVersionedDataSet(AbstractDataSet[_DI, _DO], abc.ABC):
             DataSetError: when underlying exists method raises error.
 
         """
-        self._logger.debug("Checking whether target of %s exists", str(self))
+        self._logger.debug("Checking whether target of %s exists", self)
         try:
             return self._exists()
         except VersionNotFoundError:
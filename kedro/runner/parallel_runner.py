@@ -5,14 +5,19 @@ import logging.config
 import multiprocessing
 import os
 import pickle
+import secrets
+import struct
 import sys
-from collections import Counter
-from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
 from itertools import chain
 from multiprocessing.managers import BaseProxy, SyncManager  # type: ignore
 from multiprocessing.reduction import ForkingPickler
 from pickle import PicklingError
-from typing import Any, Dict, Iterable, Optional, Set
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 from pluggy import PluginManager
 
@@ -22,7 +27,7 @@ from kedro.framework.hooks.manager import (
     _register_hooks_setuptools,
 )
 from kedro.framework.project import settings
-from kedro.io import DataCatalog, DataSetError, MemoryDataSet
+from kedro.io import AbstractDataSet, DataCatalog, DataSetError, MemoryDataSet
 from kedro.pipeline import Pipeline
 from kedro.pipeline.node import Node
 from kedro.runner.runner import AbstractRunner, run_node
@@ -30,32 +35,195 @@ from kedro.runner.runner import AbstractRunner, run_node
 # see https://github.com/python/cpython/blob/master/Lib/concurrent/futures/process.py#L114
 _MAX_WINDOWS_WORKERS = 61
 
+try:
+    if sys.platform == "win32":  # pragma: no cover
+        # Windows frees a shared memory block as soon as no process has it
+        # open, so it can't outlive the worker process which created it
+        raise ImportError
+    from multiprocessing import resource_tracker  # type: ignore
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover
+    # ``multiprocessing.shared_memory`` and pickle protocol 5 require Python 3.8
+    resource_tracker = shared_memory = None  # type: ignore
 
-class _SharedMemoryDataSet:
-    """``_SharedMemoryDataSet`` is a wrapper class for a shared MemoryDataSet in SyncManager.
-    It is not inherited from AbstractDataSet class.
+# A shared memory block of a ``_SharedMemoryDataSet`` starts with the size of
+# the pickled data and the number of its out-of-band buffers, followed by the
+# size of each buffer, the pickle and the buffers themselves.
+_HEADER = struct.Struct("<QQ")
+
+# ``MemoryDataSet`` pipeline inputs with fewer bytes of out-of-band buffers
+# than this, e.g. parameters, are cheaper to send along with the catalog
+_SHARED_MEMORY_THRESHOLD = 64 * 1024
+
+
+_TRACKER_LOCK = threading.Lock()
+
+
+def _ignore_resource(name: str, rtype: str):  # pylint: disable=unused-argument
+    pass
+
+
+@contextmanager
+def _untracked():
+    """Stops ``SharedMemory`` from registering and unregistering the blocks it
+    opens and unlinks with the resource tracker, which the workers share with
+    the main process. The tracker keeps a set of the names rather than
+    counting them, so a block opened by several workers at once would be
+    unregistered once too often. ``_SharedMemoryDataSet`` registers each
+    block once, from the main process, instead.
+    """
+    with _TRACKER_LOCK:
+        register, unregister = resource_tracker.register, resource_tracker.unregister
+        resource_tracker.register = resource_tracker.unregister = _ignore_resource
+        try:
+            yield
+        finally:
+            resource_tracker.register = register
+            resource_tracker.unregister = unregister
+
+
+def _track_shared_memory(name: str, track: bool = True):
+    # The tracker unlinks the blocks still registered once the main process
+    # and the workers have exited, e.g. if the main process was killed
+    function = resource_tracker.register if track else resource_tracker.unregister
+    with _TRACKER_LOCK:
+        function(f"/{name}", "shared_memory")
+
+
+def _open_shared_memory(**kwargs) -> Any:
+    with _untracked():
+        return shared_memory.SharedMemory(**kwargs)
+
+
+def _unlink_shared_memory(name: str) -> bool:
+    try:
+        block = _open_shared_memory(name=name)
+    except FileNotFoundError:
+        return False
+    block.close()
+    with _untracked():
+        block.unlink()
+    return True
+
+
+def _dumps(data: Any) -> Tuple[bytes, List[memoryview]]:
+    """Pickles `data` with protocol 5, keeping the out-of-band buffers of the
+    pickle (e.g. the contents of numpy arrays) apart from it.
+    """
+    buffers = []  # type: List[pickle.PickleBuffer]
+    pickled = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+    return pickled, [buffer.raw() for buffer in buffers]
+
+
+def _write_shared_memory(name: str, pickled: bytes, raw_buffers: List[memoryview]):
+    """Writes data pickled by ``_dumps`` into a new shared memory block called
+    `name`. The out-of-band buffers are copied into the block as they are.
+    """
+    header = _HEADER.pack(len(pickled), len(raw_buffers)) + struct.pack(
+        f"<{len(raw_buffers)}Q", *(raw.nbytes for raw in raw_buffers)
+    )
+    chunks = [header, pickled, *raw_buffers]
+    size = sum(len(chunk) for chunk in chunks)
+
+    try:
+        block = _open_shared_memory(name=name, create=True, size=size)
+    except FileExistsError:
+        _unlink_shared_memory(name)
+        block = _open_shared_memory(name=name, create=True, size=size)
+    if hasattr(os, "posix_fallocate"):
+        try:
+            # Reserve the pages of the block up front, so that running out of
+            # shared memory raises an error here, rather than killing the
+            # process with SIGBUS while the data is copied in
+            os.posix_fallocate(block._fd, 0, size)  # pylint: disable=protected-access
+        except OSError:
+            block.close()
+            with _untracked():
+                block.unlink()
+            raise
+    offset = 0
+    for chunk in chunks:
+        block.buf[offset : offset + len(chunk)] = chunk
+        offset += len(chunk)
+    block.close()
+
+
+def _read_shared_memory(name: str) -> Any:
+    block = _open_shared_memory(name=name)
+    try:
+        pickled_size, buffer_count = _HEADER.unpack_from(block.buf)
+        offset = _HEADER.size
+        buffer_sizes = struct.unpack_from(f"<{buffer_count}Q", block.buf, offset)
+        offset += 8 * buffer_count
+        pickled = bytes(block.buf[offset : offset + pickled_size])
+        offset += pickled_size
+        # The buffers are copied out of the block, so that the data stays
+        # valid once the block is unlinked and can't be changed by other nodes
+        buffers = []
+        for size in buffer_sizes:
+            buffers.append(bytearray(block.buf[offset : offset + size]))
+            offset += size
+    finally:
+        block.close()
+    return pickle.loads(pickled, buffers=buffers)
+
+
+class _SharedMemoryDataSet(AbstractDataSet):
+    """``_SharedMemoryDataSet`` keeps its data in a shared memory block, which
+    the main process and the workers of the ``ParallelRunner`` open directly
+    by name. Where shared memory is not available, the data is kept in a
+    shared MemoryDataSet in SyncManager instead, and data which doesn't fit
+    into shared memory is kept in a dict shared through SyncManager.
     """
 
-    def __init__(self, manager: SyncManager):
-        """Creates a new instance of ``_SharedMemoryDataSet``,
-        and creates shared memorydataset attribute.
+    def __init__(self, manager: SyncManager, overflow: Dict[str, Any] = None):
+        """Creates a new instance of ``_SharedMemoryDataSet``.
 
         Args:
-            manager: An instance of multiprocessing manager for shared objects.
+            manager: An instance of multiprocessing manager for shared objects,
+                only used where shared memory is not available.
+            overflow: A dict shared through ``manager``, which keeps the data
+                that doesn't fit into shared memory.
 
         """
-        self.shared_memory_dataset = manager.MemoryDataSet()  # type: ignore
-
-    def __getattr__(self, name):
-        # This if condition prevents recursive call when deserializing
-        if name == "__setstate__":
-            raise AttributeError()
-        return getattr(self.shared_memory_dataset, name)
+        self._name = ""
+        self._proxy = None
+        self._overflow = overflow
+        if shared_memory is None:
+            self._proxy = manager.MemoryDataSet()  # type: ignore
+        else:
+            self._name = f"kedro_{secrets.token_hex(8)}"
+            _track_shared_memory(self._name)
+        # Only the instance in the main process, which registered the block
+        # with the resource tracker, unregisters it
+        self._tracked = self._proxy is None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_tracked"] = False
+        return state
+
+    def _load(self) -> Any:
+        if self._proxy is not None:
+            return self._proxy.load()
+        try:
+            return _read_shared_memory(self._name)
+        except FileNotFoundError as exc:
+            # ``None`` can't be saved, so it means the data isn't there either
+            overflow = self._overflow
+            data = overflow.get(self._name) if overflow is not None else None
+            if data is None:
+                raise DataSetError(
+                    "Data for _SharedMemoryDataSet has not been saved yet."
+                ) from exc
+            return data
 
-    def save(self, data: Any):
-        """Calls save method of a shared MemoryDataSet in SyncManager."""
+    def _save(self, data: Any) -> None:
         try:
-            self.shared_memory_dataset.save(data)
+            if self._proxy is not None:
+                self._proxy.save(data)
+            else:
+                self._save_shared_memory(data)
         except Exception as exc:  # pylint: disable=broad-except
             # Checks if the error is due to serialisation or not
             try:
@@ -68,6 +236,54 @@ class _SharedMemoryDataSet:
             else:
                 raise exc
 
+    def _save_shared_memory(self, data: Any):
+        try:
+            _write_shared_memory(self._name, *_dumps(data))
+        except OSError:
+            if self._overflow is None:
+                raise
+            self._overflow[self._name] = data
+
+    def _exists(self) -> bool:
+        if self._proxy is not None:
+            return self._proxy.exists()
+        try:
+            _open_shared_memory(name=self._name).close()
+        except FileNotFoundError:
+            return self._overflow is not None and self._name in self._overflow
+        return True
+
+    def _release(self) -> None:
+        if self._proxy is not None:
+            self._proxy.release()
+        else:
+            unlinked = _unlink_shared_memory(self._name)
+            if not unlinked and self._overflow is not None:
+                self._overflow.pop(self._name, None)
+            self.untrack()
+
+    def untrack(self):
+        """Unregisters the block from the resource tracker of the main process,
+        once it has been unlinked, e.g. by a worker.
+        """
+        if self._tracked:
+            _track_shared_memory(self._name, track=False)
+            self._tracked = False
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(name=self._name)
+
+
+class _SharedMemoryInputDataSet(_SharedMemoryDataSet):
+    """``_SharedMemoryInputDataSet`` replaces a large ``MemoryDataSet`` pipeline
+    input whose data has been moved into a shared memory block, so that the
+    data isn't pickled again with the catalog for every task sent to the
+    workers. It can't be saved to, like any pipeline input.
+    """
+
+    def _save(self, data: Any) -> None:
+        raise DataSetError("Saving to a shared memory pipeline input is not allowed")
+
 
 class ParallelRunnerManager(SyncManager):
     """``ParallelRunnerManager`` is used to create shared ``MemoryDataSet``
@@ -91,13 +307,26 @@ def _bootstrap_subprocess(
         logging.config.dictConfig(conf_logging)
 
 
-def _run_node_synchronization(  # pylint: disable=too-many-arguments
+def _worker_init(
+    package_name: str = None, conf_logging: Optional[Dict[str, Any]] = None
+):
+    """Initialise a worker process of the ``ParallelRunner``. The project is
+    configured once per worker, rather than once for every node it runs.
+
+    Args:
+        package_name: The name of the project Python package.
+        conf_logging: A dictionary containing logging configuration.
+
+    """
+    if multiprocessing.get_start_method() == "spawn" and package_name:  # type: ignore
+        _bootstrap_subprocess(package_name, conf_logging)
+
+
+def _run_node_synchronization(
     node: Node,
     catalog: DataCatalog,
     is_async: bool = False,
     session_id: str = None,
-    package_name: str = None,
-    conf_logging: Optional[Dict[str, Any]] = None,
 ) -> Node:
     """Run a single `Node` with inputs from and outputs to the `catalog`.
     A `PluginManager` `hook_manager` instance is created in every subprocess because
@@ -109,16 +338,11 @@ def _run_node_synchronization(  # pylint: disable=too-many-arguments
         is_async: If True, the node inputs and outputs are loaded and saved
             asynchronously with threads. Defaults to False.
         session_id: The session id of the pipeline run.
-        package_name: The name of the project Python package.
-        conf_logging: A dictionary containing logging configuration.
 
     Returns:
         The node argument.
 
     """
-    if multiprocessing.get_start_method() == "spawn" and package_name:  # type: ignore
-        _bootstrap_subprocess(package_name, conf_logging)
-
     hook_manager = _create_hook_manager()
     _register_hooks(hook_manager, settings.HOOKS)
     _register_hooks_setuptools(hook_manager, settings.DISABLE_HOOKS_FOR_PLUGINS)
@@ -126,6 +350,54 @@ def _run_node_synchronization(  # pylint: disable=too-many-arguments
     return run_node(node, catalog, hook_manager, is_async, session_id)
 
 
+def _run_node_sequence(
+    pickled_nodes: List[bytes],
+    catalog: DataCatalog,
+    releases: List[List[str]],
+    is_async: bool = False,
+    session_id: str = None,
+):
+    """Run a linear chain of nodes, in which every node but the first only
+    depends on the node before it, as a single task.
+
+    Args:
+        pickled_nodes: The ``Node``s to run, in order, as they were pickled
+            when the ``ParallelRunner`` checked they could be.
+        catalog: A ``DataCatalog`` containing the nodes' inputs and outputs.
+        releases: For every node, the data sets to release once it has run,
+            which no node outside of the chain loads.
+        is_async: If True, the node inputs and outputs are loaded and saved
+            asynchronously with threads. Defaults to False.
+        session_id: The session id of the pipeline run.
+
+    """
+    for pickled_node, data_sets in zip(pickled_nodes, releases):
+        node = ForkingPickler.loads(pickled_node)
+        _run_node_synchronization(node, catalog, is_async, session_id)
+        for data_set in data_sets:
+            catalog.release(data_set)
+
+
+def _run_node_sequences(
+    sequences: List[Tuple[List[bytes], DataCatalog, List[List[str]]]],
+    is_async: bool = False,
+    session_id: str = None,
+):
+    """Run a batch of linear chains of nodes one after the other, as a single
+    task, so that the pool handles one work item for the whole batch.
+
+    Args:
+        sequences: The pickled nodes, catalog and data sets to release of
+            each chain, as taken by ``_run_node_sequence``.
+        is_async: If True, the node inputs and outputs are loaded and saved
+            asynchronously with threads. Defaults to False.
+        session_id: The session id of the pipeline run.
+
+    """
+    for pickled_nodes, catalog, releases in sequences:
+        _run_node_sequence(pickled_nodes, catalog, releases, is_async, session_id)
+
+
 class ParallelRunner(AbstractRunner):
     """``ParallelRunner`` is an ``AbstractRunner`` implementation. It can
     be used to run the ``Pipeline`` in parallel groups formed by toposort.
@@ -150,8 +422,15 @@ class ParallelRunner(AbstractRunner):
             ValueError: bad parameters passed
         """
         super().__init__(is_async=is_async)
+        self._executor = None  # type: Optional[ProcessPoolExecutor]
+        self._executor_args = None  # type: Optional[Tuple]
         self._manager = ParallelRunnerManager()
         self._manager.start()  # pylint: disable=consider-using-with
+        # Keeps the data of the default data sets which doesn't fit into
+        # shared memory
+        self._overflow = (
+            self._manager.dict() if shared_memory is not None else None
+        )  # type: Optional[Dict[str, Any]]
 
         # This code comes from the concurrent.futures library
         # https://github.com/python/cpython/blob/master/Lib/concurrent/futures/process.py#L588
@@ -163,10 +442,53 @@ class ParallelRunner(AbstractRunner):
                 max_workers = min(_MAX_WINDOWS_WORKERS, max_workers)
 
         self._max_workers = max_workers
+        # The default data sets which may still hold a shared memory block
+        self._shared_data_sets = {}  # type: Dict[str, _SharedMemoryDataSet]
 
     def __del__(self):
+        self.close()
         self._manager.shutdown()
 
+    def close(self):
+        """Shuts down the worker processes kept between runs. The runner can
+        still be used afterwards, but it will have to start new ones.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def run(
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        hook_manager: PluginManager = None,
+        session_id: str = None,
+    ) -> Dict[str, Any]:
+        """Run the ``Pipeline`` using the datasets provided by ``catalog``
+        and save results back to the same objects. Once the results are
+        collected, frees the shared memory used by the default data sets.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` from which to fetch data.
+            hook_manager: The ``PluginManager`` to activate hooks.
+            session_id: The id of the session.
+
+        Returns:
+            Any node outputs that cannot be processed by the ``DataCatalog``.
+            These are returned in a dictionary, where the keys are defined
+            by the node outputs.
+
+        """
+        try:
+            return super().run(pipeline, catalog, hook_manager, session_id)
+        finally:
+            # The default data sets are only added to the copy of the catalog
+            # made by ``run``, so nothing can load them anymore
+            for data_set in self._shared_data_sets.values():
+                data_set.release()
+            self._shared_data_sets = {}
+
     def create_default_data_set(  # type: ignore
         self, ds_name: str
     ) -> _SharedMemoryDataSet:
@@ -180,15 +502,26 @@ class ParallelRunner(AbstractRunner):
             unregistered datasets.
 
         """
-        return _SharedMemoryDataSet(self._manager)
+        data_set = _SharedMemoryDataSet(self._manager, self._overflow)
+        self._shared_data_sets[ds_name] = data_set
+        return data_set
 
     @classmethod
-    def _validate_nodes(cls, nodes: Iterable[Node]):
-        """Ensure all tasks are serializable."""
+    def _validate_nodes(cls, nodes: Iterable[Node]) -> Dict[Node, bytes]:
+        """Ensure all tasks are serializable.
+
+        Returns:
+            The pickled nodes, so that they don't need to be pickled again
+            to be sent to the workers.
+
+        Raises:
+            AttributeError: When some of the nodes cannot be serialized.
+        """
+        pickled_nodes = {}
         unserializable = []
         for node in nodes:
             try:
-                ForkingPickler.dumps(node)
+                pickled_nodes[node] = bytes(ForkingPickler.dumps(node))
             except (AttributeError, PicklingError):
                 unserializable.append(node)
 
@@ -201,6 +534,7 @@ class ParallelRunner(AbstractRunner):
                 f"are using custom decorators ensure they are correctly decorated using "
                 f"functools.wraps()."
             )
+        return pickled_nodes
 
     @classmethod
     def _validate_catalog(cls, catalog: DataCatalog, pipeline: Pipeline):
@@ -232,9 +566,10 @@ class ParallelRunner(AbstractRunner):
             )
 
         memory_datasets = []
+        all_outputs = pipeline.all_outputs()
         for name, data_set in data_sets.items():
             if (
-                name in pipeline.all_outputs()
+                name in all_outputs
                 and isinstance(data_set, MemoryDataSet)
                 and not isinstance(data_set, BaseProxy)
             ):
@@ -258,10 +593,159 @@ class ParallelRunner(AbstractRunner):
         # because each layer means some nodes depend on other nodes
         # and they can not run in parallel.
         # It might be not a perfect solution, but good enough and simple.
-        required_processes = len(pipeline.nodes) - len(pipeline.grouped_nodes) + 1
+        # The node count is taken from the groups, so that the topologically
+        # sorted nodes are only copied once.
+        grouped_nodes = pipeline.grouped_nodes
+        required_processes = sum(map(len, grouped_nodes)) - len(grouped_nodes) + 1
 
         return min(required_processes, self._max_workers)
 
+    def _share_memory_inputs(self, catalog: DataCatalog, pipeline_inputs: Set[str]):
+        """Moves the large data of the ``MemoryDataSet`` pipeline inputs into
+        shared memory once, instead of sending it to the workers with every
+        task.
+        """
+        if shared_memory is None:
+            return
+        data_sets = catalog._data_sets  # pylint: disable=protected-access
+        for name in pipeline_inputs:
+            data_set = data_sets.get(name)
+            if (
+                not isinstance(data_set, MemoryDataSet)
+                or isinstance(data_set, BaseProxy)
+                or not data_set.exists()
+            ):
+                continue
+            pickled, raw_buffers = _dumps(
+                data_set._data  # pylint: disable=protected-access
+            )
+            if sum(raw.nbytes for raw in raw_buffers) < _SHARED_MEMORY_THRESHOLD:
+                continue
+            shared_data_set = _SharedMemoryInputDataSet(self._manager)
+            try:
+                # Every load returns a new copy of the data, like it does from
+                # the ``MemoryDataSet``
+                _write_shared_memory(
+                    shared_data_set._name,  # pylint: disable=protected-access
+                    pickled,
+                    raw_buffers,
+                )
+            except OSError:
+                # The data doesn't fit into shared memory, so it is sent
+                # along with the catalog instead
+                shared_data_set.release()
+                continue
+            self._shared_data_sets[name] = shared_data_set
+            # ``catalog`` is the copy made by ``run``, so the catalog passed
+            # in by the user is left untouched
+            catalog.add(name, shared_data_set, replace=True)
+
+    def _get_executor(self, max_workers: int) -> ProcessPoolExecutor:
+        """Returns the pool of worker processes. The pool is kept between runs,
+        so that repeated runs don't pay for starting the workers again, and is
+        only replaced when a different number of workers or a different
+        project configuration is required.
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from kedro.framework.project import LOGGING, PACKAGE_NAME
+
+        executor_args = (max_workers, PACKAGE_NAME, LOGGING)
+        if self._executor is None or self._executor_args != executor_args:
+            self.close()
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_worker_init,
+                initargs=(PACKAGE_NAME, LOGGING),
+            )
+            self._executor_args = executor_args
+        return self._executor
+
+    @staticmethod
+    def _fuse_linear_chains(
+        node_dependencies: Dict[Node, Set[Node]], dependents: Dict[Node, List[Node]]
+    ) -> Dict[Node, List[Node]]:
+        """Groups the nodes into linear chains, in which every node but the
+        first only depends on the node before it, and is the only node which
+        depends on it. Running a chain as a single task doesn't lose any
+        parallelism, and saves sending every node to the workers separately.
+
+        Returns:
+            The chains, keyed by their first node.
+        """
+
+        def follows_only(node):
+            deps = node_dependencies[node]
+            return len(deps) == 1 and len(dependents[next(iter(deps))]) == 1
+
+        chains = {}
+        for node in node_dependencies:
+            if follows_only(node):
+                continue
+            sequence = [node]
+            while len(dependents[sequence[-1]]) == 1:
+                next_node = dependents[sequence[-1]][0]
+                if not follows_only(next_node):
+                    break
+                sequence.append(next_node)
+            chains[node] = sequence
+        return chains
+
+    @staticmethod
+    def _prepare_chain(
+        nodes: List[Node],
+        catalog: DataCatalog,
+        load_counts: Dict[str, int],
+        pipeline_inputs: Set[str],
+        pipeline_outputs: Set[str],
+    ) -> Tuple[DataCatalog, List[List[str]]]:
+        """Works out which data sets the chain of `nodes` releases itself,
+        because only its own nodes load them, and keeps those which are
+        default data sets in the worker running the chain. The chain is run
+        with a catalog of only the data sets its nodes use, which is all that
+        needs to be sent to the worker.
+
+        Returns:
+            The catalog to run the chain with and the data sets to release
+            after each of its nodes.
+        """
+        chain_loads = Counter(chain.from_iterable(n.inputs for n in nodes))
+        # All the nodes loading these data sets are part of the chain
+        remaining = {
+            data_set: count
+            for data_set, count in chain_loads.items()
+            if count == load_counts[data_set]
+        }
+        releases = []
+        for node in nodes:
+            node_releases = []
+            for data_set in node.inputs:
+                if data_set in remaining:
+                    remaining[data_set] -= 1
+                    if remaining[data_set] < 1 and data_set not in pipeline_inputs:
+                        node_releases.append(data_set)
+            for data_set in node.outputs:
+                if load_counts[data_set] < 1 and data_set not in pipeline_outputs:
+                    node_releases.append(data_set)
+            releases.append(node_releases)
+
+        data_sets = catalog._data_sets  # pylint: disable=protected-access
+        chain_data_sets = {
+            data_set: data_sets[data_set]
+            for node in nodes
+            for data_set in chain(node.inputs, node.outputs)
+            if data_set in data_sets
+        }
+        released = set(chain.from_iterable(releases))
+        for node in nodes:
+            for data_set in node.outputs:
+                if data_set in released and isinstance(
+                    data_sets.get(data_set), _SharedMemoryDataSet
+                ):
+                    # Nothing else loads the data, so it can be passed on as
+                    # it is within the worker
+                    chain_data_sets[data_set] = MemoryDataSet(copy_mode="assign")
+        return DataCatalog(chain_data_sets, layers=catalog.layers), releases
+
     def _run(  # pylint: disable=too-many-locals,useless-suppression
         self,
         pipeline: Pipeline,
@@ -284,42 +768,68 @@ class ParallelRunner(AbstractRunner):
             Exception: In case of any downstream node failure.
 
         """
-        # pylint: disable=import-outside-toplevel,cyclic-import
-
         nodes = pipeline.nodes
         self._validate_catalog(catalog, pipeline)
-        self._validate_nodes(nodes)
+        pickled_nodes = self._validate_nodes(nodes)
 
         load_counts = Counter(chain.from_iterable(n.inputs for n in nodes))
+        pipeline_inputs = pipeline.inputs()
+        pipeline_outputs = pipeline.outputs()
+        self._share_memory_inputs(catalog, pipeline_inputs)
         node_dependencies = pipeline.node_dependencies
-        todo_nodes = set(node_dependencies.keys())
+        # Index which nodes depend on each node, so that a completed node only
+        # needs to update its own dependents instead of rescanning all nodes
+        dependents = defaultdict(list)  # type: Dict[Node, List[Node]]
+        remaining_deps = {}  # type: Dict[Node, int]
+        for node, deps in node_dependencies.items():
+            remaining_deps[node] = len(deps)
+            for dep in deps:
+                dependents[dep].append(node)
+        chains = self._fuse_linear_chains(node_dependencies, dependents)
+        # The pickled nodes, catalog and data sets to release of each chain
+        sequences = {
+            head: (
+                [pickled_nodes[n] for n in nodes_],
+                *self._prepare_chain(
+                    nodes_, catalog, load_counts, pipeline_inputs, pipeline_outputs
+                ),
+            )
+            for head, nodes_ in chains.items()
+        }
+        # The data sets which the workers release themselves are kept here
+        released_in_workers = {
+            data_set
+            for _, _, releases in sequences.values()
+            for data_set in chain.from_iterable(releases)
+        }
+        release_data_sets = partial(
+            self._release_data_sets,
+            catalog=catalog,
+            load_counts=load_counts,
+            kept_inputs=pipeline_inputs | released_in_workers,
+        )
+        run_sequences = partial(
+            _run_node_sequences, is_async=self._is_async, session_id=session_id
+        )
+        ready = [n for n in chains if not remaining_deps[n]]
         done_nodes = set()  # type: Set[Node]
-        futures = set()
+        # The first nodes of the chains each future runs
+        futures = {}  # type: Dict[Future, List[Node]]
         done = None
         max_workers = self._get_required_workers_count(pipeline)
-
-        from kedro.framework.project import LOGGING, PACKAGE_NAME
-
-        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        pool = self._get_executor(max_workers)
+        finished = False
+        try:
             while True:
-                ready = {n for n in todo_nodes if node_dependencies[n] <= done_nodes}
-                todo_nodes -= ready
-                for node in ready:
-                    futures.add(
-                        pool.submit(
-                            _run_node_synchronization,
-                            node,
-                            catalog,
-                            self._is_async,
-                            session_id,
-                            package_name=PACKAGE_NAME,
-                            conf_logging=LOGGING,
-                        )
+                futures.update(
+                    self._submit_chains(
+                        pool, run_sequences, ready, sequences, max_workers
                     )
+                )
                 if not futures:
-                    if todo_nodes:
+                    if len(done_nodes) < len(nodes):
                         debug_data = {
-                            "todo_nodes": todo_nodes,
+                            "todo_nodes": set(nodes) - done_nodes,
                             "done_nodes": done_nodes,
                             "ready_nodes": ready,
                             "done_futures": done,
@@ -331,29 +841,113 @@ class ParallelRunner(AbstractRunner):
                             f"Unable to schedule new tasks although some nodes "
                             f"have not been run:\n{debug_data_str}"
                         )
+                    finished = True
                     break  # pragma: no cover
-                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                ready = []
                 for future in done:
+                    heads = futures.pop(future)
                     try:
-                        node = future.result()
+                        future.result()
                     except Exception:
                         self._suggest_resume_scenario(pipeline, done_nodes)
                         raise
-                    done_nodes.add(node)
-
-                    # Decrement load counts, and release any datasets we
-                    # have finished with. This is particularly important
-                    # for the shared, default datasets we created above.
-                    for data_set in node.inputs:
-                        load_counts[data_set] -= 1
-                        if (
-                            load_counts[data_set] < 1
-                            and data_set not in pipeline.inputs()
-                        ):
-                            catalog.release(data_set)
-                    for data_set in node.outputs:
-                        if (
-                            load_counts[data_set] < 1
-                            and data_set not in pipeline.outputs()
-                        ):
-                            catalog.release(data_set)
+                    completed = self._complete_chains(
+                        heads, chains, sequences, release_data_sets
+                    )
+                    done_nodes.update(completed)
+                    ready.extend(
+                        self._get_ready_chains(
+                            completed, dependents, remaining_deps, chains
+                        )
+                    )
+        finally:
+            if not finished:
+                # Wait for the nodes still running, rather than leaving them
+                # to the next run
+                self.close()
+
+    @staticmethod
+    def _submit_chains(
+        pool: ProcessPoolExecutor,
+        run_sequences: Callable[[List[Tuple]], None],
+        heads: List[Node],
+        sequences: Mapping[Node, Tuple],
+        max_workers: int,
+    ) -> Dict[Future, List[Node]]:
+        """Sends the chains starting with `heads` to the workers. Wide
+        pipelines can make many chains ready at once, which are sent to the
+        workers in batches rather than one by one.
+
+        Returns:
+            The submitted futures, each with the first nodes of the chains
+            it runs.
+        """
+        futures = {}
+        batch_size = max(1, len(heads) // (4 * max_workers))
+        for start in range(0, len(heads), batch_size):
+            batch = heads[start : start + batch_size]
+            future = pool.submit(run_sequences, [sequences[head] for head in batch])
+            futures[future] = batch
+        return futures
+
+    def _complete_chains(
+        self,
+        heads: List[Node],
+        chains: Dict[Node, List[Node]],
+        sequences: Mapping[Node, Tuple],
+        release_data_sets: Callable[[Node], None],
+    ) -> List[Node]:
+        """Releases the data sets the chains starting with `heads` have
+        finished with, and stops tracking those the workers released already.
+
+        Returns:
+            The nodes of the chains.
+        """
+        completed = []
+        for head in heads:
+            _, _, releases = sequences[head]
+            for node, data_sets in zip(chains[head], releases):
+                release_data_sets(node)
+                for data_set in data_sets:
+                    if data_set in self._shared_data_sets:
+                        self._shared_data_sets.pop(data_set).untrack()
+                completed.append(node)
+        return completed
+
+    @staticmethod
+    def _get_ready_chains(
+        nodes: List[Node],
+        dependents: Dict[Node, List[Node]],
+        remaining_deps: Dict[Node, int],
+        chains: Dict[Node, List[Node]],
+    ) -> List[Node]:
+        """Counts `nodes` as done for the nodes depending on them.
+
+        Returns:
+            The first nodes of the chains which can be run now.
+        """
+        ready = []
+        for node in nodes:
+            for dependent in dependents[node]:
+                remaining_deps[dependent] -= 1
+                if not remaining_deps[dependent] and dependent in chains:
+                    ready.append(dependent)
+        return ready
+
+    def _release_data_sets(
+        self,
+        node: Node,
+        catalog: DataCatalog,
+        load_counts: Dict[str, int],
+        kept_inputs: Set[str],
+    ):
+        # Decrement load counts, and release any datasets we
+        # have finished with. This is particularly important
+        # for the shared, default datasets. Outputs which no node loads are
+        # always released by the worker which saved them.
+        for data_set in node.inputs:
+            load_counts[data_set] -= 1
+            if load_counts[data_set] < 1 and data_set not in kept_inputs:
+                catalog.release(data_set)
+                self._shared_data_sets.pop(data_set, None)
@@ -63,6 +63,8 @@ class SequentialRunner(AbstractRunner):
         done_nodes = set()
 
         load_counts = Counter(chain.from_iterable(n.inputs for n in nodes))
+        pipeline_inputs = pipeline.inputs()
+        pipeline_outputs = pipeline.outputs()
 
         for exec_index, node in enumerate(nodes):
             try:
@@ -75,10 +77,10 @@ class SequentialRunner(AbstractRunner):
             # decrement load counts and release any data sets we've finished with
             for data_set in node.inputs:
                 load_counts[data_set] -= 1
-                if load_counts[data_set] < 1 and data_set not in pipeline.inputs():
+                if load_counts[data_set] < 1 and data_set not in pipeline_inputs:
                     catalog.release(data_set)
             for data_set in node.outputs:
-                if load_counts[data_set] < 1 and data_set not in pipeline.outputs():
+                if load_counts[data_set] < 1 and data_set not in pipeline_outputs:
                     catalog.release(data_set)
 
             self._logger.info(
@@ -2,11 +2,13 @@
 be used to run the ``Pipeline`` in parallel groups formed by toposort
 using threads.
 """
+import logging
 import warnings
-from collections import Counter
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
-from itertools import chain
-from typing import Set
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from queue import SimpleQueue
+from typing import Dict, List, Set
 
 from pluggy import PluginManager
 
@@ -72,7 +74,10 @@ class ThreadRunner(AbstractRunner):
         # because each layer means some nodes depend on other nodes
         # and they can not run in parallel.
         # It might be not a perfect solution, but good enough and simple.
-        required_threads = len(pipeline.nodes) - len(pipeline.grouped_nodes) + 1
+        # The node count is taken from the groups, so that the topologically
+        # sorted nodes are only copied once.
+        grouped_nodes = pipeline.grouped_nodes
+        required_threads = sum(map(len, grouped_nodes)) - len(grouped_nodes) + 1
 
         return (
             min(required_threads, self._max_workers)
@@ -99,57 +104,92 @@ class ThreadRunner(AbstractRunner):
 
         """
         nodes = pipeline.nodes
-        load_counts = Counter(chain.from_iterable(n.inputs for n in nodes))
+        load_counts = {}  # type: Dict[str, int]
+        for node in nodes:
+            for data_set in node.inputs:
+                load_counts[data_set] = load_counts.get(data_set, 0) + 1
+        pipeline_inputs = pipeline.inputs()
+        pipeline_outputs = pipeline.outputs()
         node_dependencies = pipeline.node_dependencies
-        todo_nodes = set(node_dependencies.keys())
+        # Index which nodes depend on each node, so that a completed node only
+        # needs to update its own dependents instead of rescanning all nodes
+        dependents = {n: [] for n in node_dependencies}  # type: Dict[Node, List[Node]]
+        remaining_deps = {}  # type: Dict[Node, int]
+        for node, deps in node_dependencies.items():
+            remaining_deps[node] = len(deps)
+            for dep in deps:
+                dependents[dep].append(node)
+        ready = deque(n for n, count in remaining_deps.items() if not count)
         done_nodes = set()  # type: Set[Node]
-        futures = set()
-        done = None
+        futures = {}  # type: Dict[Future, Node]
+        # Futures put themselves in this queue once done, so that waiting for
+        # the next completed node doesn't need to check every pending future
+        completed = SimpleQueue()  # type: SimpleQueue[Future]
         max_workers = self._get_required_workers_count(pipeline)
+        logger = self._logger
+        log_progress = logger.isEnabledFor(logging.INFO)
+        total_nodes = len(nodes)
+        run_bound_node = partial(
+            run_node,
+            catalog=catalog,
+            hook_manager=hook_manager,
+            is_async=self._is_async,
+            session_id=session_id,
+        )
 
         with ThreadPoolExecutor(max_workers=max_workers) as pool:
-            while True:
-                ready = {n for n in todo_nodes if node_dependencies[n] <= done_nodes}
-                todo_nodes -= ready
-                for node in ready:
-                    futures.add(
-                        pool.submit(
-                            run_node,
-                            node,
-                            catalog,
-                            hook_manager,
-                            self._is_async,
-                            session_id,
-                        )
-                    )
-                if not futures:
-                    assert not todo_nodes, (todo_nodes, done_nodes, ready, done)
-                    break
-                done, futures = wait(futures, return_when=FIRST_COMPLETED)
-                for future in done:
-                    try:
-                        node = future.result()
-                    except Exception:
-                        self._suggest_resume_scenario(pipeline, done_nodes)
-                        raise
-                    done_nodes.add(node)
-                    self._logger.info("Completed node: %s", node.name)
-                    self._logger.info(
-                        "Completed %d out of %d tasks", len(done_nodes), len(nodes)
+
+            def submit_ready():
+                while ready:
+                    node = ready.popleft()
+                    future = pool.submit(run_bound_node, node)
+                    futures[future] = node
+                    future.add_done_callback(completed.put)
+
+            submit_ready()
+            while futures:
+                future = completed.get()
+                node = futures.pop(future)
+                exception = future.exception()
+                if exception is not None:
+                    self._suggest_resume_scenario(pipeline, done_nodes)
+                    raise exception
+                done_nodes.add(node)
+                if log_progress:
+                    logger.info("Completed node: %s", node.name)
+                    logger.info(
+                        "Completed %d out of %d tasks", len(done_nodes), total_nodes
                     )
 
-                    # Decrement load counts, and release any datasets we
-                    # have finished with.
-                    for data_set in node.inputs:
-                        load_counts[data_set] -= 1
-                        if (
-                            load_counts[data_set] < 1
-                            and data_set not in pipeline.inputs()
-                        ):
-                            catalog.release(data_set)
-                    for data_set in node.outputs:
-                        if (
-                            load_counts[data_set] < 1
-                            and data_set not in pipeline.outputs()
-                        ):
-                            catalog.release(data_set)
+                self._release_data_sets(
+                    node, catalog, load_counts, pipeline_inputs, pipeline_outputs
+                )
+
+                # Submit the dependents which became ready straight away
+                for dependent in dependents[node]:
+                    remaining_deps[dependent] -= 1
+                    if not remaining_deps[dependent]:
+                        ready.append(dependent)
+                submit_ready()
+
+        assert len(done_nodes) == total_nodes, (remaining_deps, done_nodes)
+
+    @staticmethod
+    def _release_data_sets(
+        node: Node,
+        catalog: DataCatalog,
+        load_counts: Dict[str, int],
+        pipeline_inputs: Set[str],
+        pipeline_outputs: Set[str],
+    ):
+        # Decrement load counts, and release any datasets we
+        # have finished with.
+        for data_set in node.inputs:
+            load_counts[data_set] -= 1
+            if load_counts[data_set] < 1 and data_set not in pipeline_inputs:
+                catalog.release(data_set)
+        # Outputs loaded by other nodes are released with the
+        # inputs above, so only the unconsumed ones are left here
+        for data_set in node.outputs:
+            if data_set not in load_counts and data_set not in pipeline_outputs:
+                catalog.release(data_set)
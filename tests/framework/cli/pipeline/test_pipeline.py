@@ -8,7 +8,7 @@ from click.testing import CliRunner
 from pandas import DataFrame
 
 from kedro.extras.datasets.pandas import CSVDataSet
-from kedro.framework.cli.pipeline import _sync_dirs
+from kedro.framework.cli.pipeline import _remove_tree, _sync_dirs
 from kedro.framework.project import settings
 from kedro.framework.session import KedroSession
 
@@ -341,7 +341,7 @@ class TestPipelineDeleteCommand:
         source_path = fake_package_path / "pipelines" / PIPELINE_NAME
 
         mocker.patch(
-            "kedro.framework.cli.pipeline.shutil.rmtree",
+            "kedro.framework.cli.pipeline._remove_tree",
             side_effect=PermissionError("permission"),
         )
         result = CliRunner().invoke(
@@ -520,3 +520,62 @@ class TestSyncDirs:
         assert (target / "existing" / "common").read_text(encoding="utf-8") == "source"
         assert not (target / "existing" / "target_file").exists()
         assert (target / "new" / "source_file").is_file()
+
+    def test_sync_nested_dirs(self, source, tmp_path):
+        """Test _sync_dirs utility function copies deeply nested directories."""
+        nested = source / "new" / "level_1" / "level_2"
+        nested.mkdir(parents=True)
+        (nested / "deep_file").write_text("deep", encoding="utf-8")
+        (source / "top_file").touch()
+        target = Path(tmp_path) / "target"
+
+        _sync_dirs(source, target)
+
+        assert (target / "top_file").is_file()
+        assert (target / "new" / "source_file").is_file()
+        deep_file = target / "new" / "level_1" / "level_2" / "deep_file"
+        assert deep_file.read_text(encoding="utf-8") == "deep"
+
+
+class TestRemoveTree:
+    def test_remove_nested_tree(self, tmp_path):
+        """Test _remove_tree removes all nested files and directories."""
+        root = tmp_path / "root"
+        (root / "nested" / "deeper").mkdir(parents=True)
+        (root / "file").touch()
+        (root / "nested" / "deeper" / "file").touch()
+
+        _remove_tree(root)
+
+        assert not root.exists()
+
+    def test_symlinks_not_followed(self, tmp_path):
+        """Test _remove_tree removes symlinks without touching their targets."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep").touch()
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "link").symlink_to(outside, target_is_directory=True)
+
+        _remove_tree(root)
+
+        assert not root.exists()
+        assert (outside / "keep").is_file()
+
+    def test_symlink_root_not_followed(self, tmp_path):
+        """Test _remove_tree only removes the symlink passed as the root."""
+        outside = tmp_path / "outside"
+        (outside / "nested").mkdir(parents=True)
+        (outside / "nested" / "keep").touch()
+        root = tmp_path / "root"
+        root.symlink_to(outside, target_is_directory=True)
+
+        _remove_tree(root)
+
+        assert not root.is_symlink()
+        assert (outside / "nested" / "keep").is_file()
+
+    def test_missing_path(self, tmp_path):
+        """Test _remove_tree ignores paths which do not exist."""
+        _remove_tree(tmp_path / "missing")
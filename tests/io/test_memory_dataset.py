@@ -1,3 +1,4 @@
+import logging
 import re
 
 # pylint: disable=unused-argument
@@ -173,6 +174,18 @@ class TestMemoryDataSet:
         data_set.save(new_data)
         assert data_set.exists()
 
+    def test_release(self, memory_dataset):
+        """Test `release` drops the data"""
+        memory_dataset.release()
+        assert not memory_dataset.exists()
+
+    def test_release_without_debug_logging(self, memory_dataset, mocker, caplog):
+        """Test `release` doesn't describe the data set unless it is logged"""
+        caplog.set_level(logging.INFO, logger="kedro.io.core")
+        mocked_str = mocker.patch.object(MemoryDataSet, "__str__")
+        memory_dataset.release()
+        mocked_str.assert_not_called()
+
 
 @pytest.mark.parametrize("data", [["a", "b"], [{"a": "b"}, {"c": "d"}]])
 def test_copy_mode_assign(data):
@@ -40,7 +40,9 @@ def catalog():
     return DataCatalog()
 
 
-@pytest.fixture
+# Pipelines can't be modified once created, so the pipeline fixtures are
+# shared by all the tests instead of being built again for every test.
+@pytest.fixture(scope="session")
 def fan_out_fan_in():
     return Pipeline(
         [
@@ -53,7 +55,7 @@ def fan_out_fan_in():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def branchless_no_input_pipeline():
     """The pipeline runs in the order A->B->C->D->E."""
     return Pipeline(
@@ -67,7 +69,7 @@ def branchless_no_input_pipeline():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def branchless_pipeline():
     return Pipeline(
         [
@@ -77,12 +79,12 @@ def branchless_pipeline():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def saving_result_pipeline():
     return Pipeline([node(identity, "ds", "dsX")])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def saving_none_pipeline():
     return Pipeline(
         [node(random, None, "A"), node(return_none, "A", "B"), node(identity, "B", "C")]
@@ -1,7 +1,14 @@
+import errno
+import pickle
 import sys
 from concurrent.futures.process import ProcessPoolExecutor
+from contextlib import ExitStack
+from types import MappingProxyType, SimpleNamespace
 from typing import Any, Dict
+from unittest import mock
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from kedro.framework.hooks import _create_hook_manager
@@ -13,12 +20,18 @@ from kedro.io import (
     MemoryDataSet,
 )
 from kedro.pipeline import Pipeline, node
-from kedro.runner import ParallelRunner
+from kedro.runner import ParallelRunner, parallel_runner
 from kedro.runner.parallel_runner import (
+    _HEADER,
     _MAX_WINDOWS_WORKERS,
     ParallelRunnerManager,
+    _open_shared_memory,
+    _run_node_sequence,
+    _run_node_sequences,
     _run_node_synchronization,
     _SharedMemoryDataSet,
+    _SharedMemoryInputDataSet,
+    _worker_init,
 )
 from tests.runner.conftest import (
     exception_fn,
@@ -34,10 +47,30 @@ from tests.runner.conftest import (
     sys.platform.startswith("win"), reason="Due to bug in parallel runner"
 )
 class TestValidParallelRunner:
+    @pytest.fixture(autouse=True, params=["shared_memory", "manager"])
+    def transport(self, request, mocker):
+        """Passes the data of the default data sets through shared memory, or
+        through the manager as where shared memory is not available.
+        """
+        if request.param == "manager":
+            mocker.patch("kedro.runner.parallel_runner.shared_memory", None)
+        return request.param
+
     def test_create_default_data_set(self):
-        # data_set is a proxy to a dataset in another process.
-        data_set = ParallelRunner().create_default_data_set("")
+        runner = ParallelRunner()
+        data_set = runner.create_default_data_set("")
         assert isinstance(data_set, _SharedMemoryDataSet)
+        data_set.release()
+
+    def test_default_data_set_save_and_load(self):
+        runner = ParallelRunner()
+        data_set = runner.create_default_data_set("")
+        assert not data_set.exists()
+        data_set.save(42)
+        assert data_set.exists()
+        assert data_set.load() == 42
+        data_set.release()
+        assert not data_set.exists()
 
     @pytest.mark.parametrize("is_async", [False, True])
     def test_parallel_run(self, is_async, fan_out_fan_in, catalog):
@@ -66,6 +99,262 @@ class TestValidParallelRunner:
         assert len(result["Z"]) == 3
         assert result["Z"] == ("42", "42", "42")
 
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_parallel_run_large_array(self, is_async, fan_out_fan_in, catalog):
+        data = np.arange(100_000)
+        catalog.add_feed_dict(dict(A=data))
+        result = ParallelRunner(is_async=is_async).run(fan_out_fan_in, catalog)
+        assert len(result["Z"]) == 3
+        for array in result["Z"]:
+            np.testing.assert_array_equal(array, data)
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_memory_dataset_large_input(self, is_async, fan_out_fan_in):
+        data = np.arange(100_000)
+        catalog = DataCatalog({"A": MemoryDataSet(data)})
+        result = ParallelRunner(is_async=is_async).run(fan_out_fan_in, catalog)
+        assert len(result["Z"]) == 3
+        for array in result["Z"]:
+            np.testing.assert_array_equal(array, data)
+        # the catalog passed in still holds the original data set
+        assert isinstance(catalog._data_sets["A"], MemoryDataSet)
+
+    def test_linear_chain_run_as_one_task(self, mocker, branchless_no_input_pipeline):
+        submit = mocker.spy(ProcessPoolExecutor, "submit")
+        result = ParallelRunner().run(branchless_no_input_pipeline, DataCatalog())
+        assert isinstance(result["E"], float)
+        submit.assert_called_once()
+
+    def test_fan_out_fan_in_not_fused(self, mocker, fan_out_fan_in, catalog):
+        submit = mocker.spy(ProcessPoolExecutor, "submit")
+        catalog.add_feed_dict(dict(A=42))
+        ParallelRunner().run(fan_out_fan_in, catalog)
+        assert submit.call_count == 5
+
+    def test_validate_nodes_returns_pickled_nodes(self, fan_out_fan_in):
+        pickled_nodes = ParallelRunner._validate_nodes(fan_out_fan_in.nodes)
+        assert pickled_nodes.keys() == set(fan_out_fan_in.nodes)
+        for node_, pickled in pickled_nodes.items():
+            assert pickle.loads(pickled) == node_
+
+    def test_wide_pipeline_submitted_in_batches(self, mocker):
+        submit = mocker.spy(ProcessPoolExecutor, "submit")
+        pipeline = Pipeline([node(source, None, f"out{i}") for i in range(16)])
+        result = ParallelRunner(max_workers=1).run(pipeline, DataCatalog())
+        assert result == {f"out{i}": "stuff" for i in range(16)}
+        # 16 ready nodes for a single worker are sent in batches of 4
+        assert submit.call_count == 4
+
+    def test_chain_catalog_only_has_used_data_sets(self, fan_out_fan_in):
+        catalog = DataCatalog(
+            {
+                "A": MemoryDataSet(42),
+                "unused": MemoryDataSet(np.arange(100_000)),
+            }
+        )
+        first_node = fan_out_fan_in.only_nodes_with_inputs("A").nodes
+        chain_catalog, _ = ParallelRunner._prepare_chain(
+            first_node, catalog, {"A": 1, "B": 3}, {"A"}, {"Z"}
+        )
+        assert chain_catalog.list() == ["A"]
+        assert len(pickle.dumps(chain_catalog)) < len(pickle.dumps(catalog))
+
+    def test_executor_reused_between_runs(self, mocker, fan_out_fan_in, catalog):
+        executor_cls_mock = mocker.patch(
+            "kedro.runner.parallel_runner.ProcessPoolExecutor",
+            wraps=ProcessPoolExecutor,
+        )
+        catalog.add_feed_dict(dict(A=42))
+        runner = ParallelRunner()
+        assert runner.run(fan_out_fan_in, catalog) == {"Z": (42, 42, 42)}
+        assert runner.run(fan_out_fan_in, catalog) == {"Z": (42, 42, 42)}
+        executor_cls_mock.assert_called_once()
+
+        runner.close()
+        assert runner.run(fan_out_fan_in, catalog) == {"Z": (42, 42, 42)}
+        assert executor_cls_mock.call_count == 2
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+)
+@pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="Shared memory requires Python 3.8"
+)
+class TestSharedMemoryDataSet:
+    @pytest.fixture
+    def data_set(self):
+        runner = ParallelRunner()
+        data_set = runner.create_default_data_set("")
+        yield data_set
+        data_set.release()
+
+    def test_save_and_load(self, data_set):
+        data_set.save({"a": 1})
+        assert data_set.load() == {"a": 1}
+
+    def test_large_data(self, data_set):
+        data = np.arange(100_000)
+        data_set.save(data)
+        assert data_set.exists()
+        loaded = data_set.load()
+        np.testing.assert_array_equal(loaded, data)
+        # the loaded data doesn't refer to the shared memory block
+        loaded[0] = -1
+        assert data_set.load()[0] == 0
+
+        data_set.release()
+        assert not data_set.exists()
+
+    def test_dataframe_columns_out_of_band(self, data_set):
+        """The column data of a pandas DataFrame is copied into the block as
+        raw buffers, rather than as part of the pickle."""
+        data = pd.DataFrame({"a": np.arange(100_000), "b": np.ones(100_000)})
+        data_set.save(data)
+        block = _open_shared_memory(name=data_set._name)
+        try:
+            pickled_size, buffer_count = _HEADER.unpack_from(block.buf)
+        finally:
+            block.close()
+        assert buffer_count > 0
+        assert pickled_size < data.memory_usage(index=False).sum()
+        pd.testing.assert_frame_equal(data_set.load(), data)
+
+    def test_exists_after_save(self, data_set):
+        data_set.save("stuff")
+        assert data_set.exists()
+
+    def test_save_error_not_serialisation(self, mocker, data_set):
+        mocker.patch(
+            "kedro.runner.parallel_runner._write_shared_memory",
+            side_effect=ValueError("Invalid data"),
+        )
+        pattern = "Invalid data"
+        with pytest.raises(DataSetError, match=pattern):
+            data_set.save("stuff")
+
+    def test_save_not_serializable(self, data_set):
+        pattern = r"cannot be serialized. ParallelRunner implicit memory datasets"
+        with pytest.raises(DataSetError, match=pattern):
+            data_set.save(lambda: "stuff")
+
+    def test_save_twice(self, data_set):
+        data_set.save("first")
+        data_set.save("second")
+        assert data_set.load() == "second"
+
+    def test_block_tracked_once(self, mocker):
+        resource_tracker = parallel_runner.resource_tracker
+        register = mocker.spy(resource_tracker, "register")
+        unregister = mocker.spy(resource_tracker, "unregister")
+        runner = ParallelRunner()
+        data_set = runner.create_default_data_set("")
+        data_set.save("stuff")
+        assert data_set.load() == "stuff"
+        # a worker releasing its copy of the data set leaves it registered
+        pickle.loads(pickle.dumps(data_set)).release()
+        register.assert_called_once_with(f"/{data_set._name}", "shared_memory")
+        unregister.assert_not_called()
+
+        data_set.release()
+        unregister.assert_called_once_with(f"/{data_set._name}", "shared_memory")
+
+    @pytest.fixture
+    def no_space(self, mocker):
+        return mocker.patch(
+            "os.posix_fallocate",
+            side_effect=OSError(errno.ENOSPC, "No space left on device"),
+            create=True,
+        )
+
+    @pytest.mark.usefixtures("no_space")
+    def test_overflow_to_manager(self, data_set):
+        data = np.arange(100_000)
+        data_set.save(data)
+        with pytest.raises(FileNotFoundError):
+            _open_shared_memory(name=data_set._name)
+        assert data_set.exists()
+        np.testing.assert_array_equal(data_set.load(), data)
+
+        data_set.release()
+        assert not data_set.exists()
+
+    @pytest.mark.usefixtures("no_space")
+    def test_parallel_run_overflow(self, fan_out_fan_in, catalog):
+        data = np.arange(100_000)
+        catalog.add_feed_dict(dict(A=data))
+        result = ParallelRunner().run(fan_out_fan_in, catalog)
+        for array in result["Z"]:
+            np.testing.assert_array_equal(array, data)
+
+    @pytest.mark.usefixtures("no_space")
+    def test_large_input_not_shared_without_space(self):
+        catalog = DataCatalog({"large": MemoryDataSet(np.arange(100_000))})
+        runner = ParallelRunner()
+        runner._share_memory_inputs(catalog, {"large"})
+        assert isinstance(catalog._data_sets["large"], MemoryDataSet)
+        assert runner._shared_data_sets == {}
+
+    def test_load_not_saved(self, data_set):
+        assert not data_set.exists()
+        pattern = "Data for _SharedMemoryDataSet has not been saved yet"
+        with pytest.raises(DataSetError, match=pattern):
+            data_set.load()
+
+    def test_share_only_large_memory_inputs(self):
+        data = np.arange(100_000)
+        catalog = DataCatalog(
+            {"large": MemoryDataSet(data), "params:small": MemoryDataSet(1)}
+        )
+        runner = ParallelRunner()
+        runner._share_memory_inputs(catalog, {"large", "params:small"})
+        assert isinstance(catalog._data_sets["large"], _SharedMemoryInputDataSet)
+        assert isinstance(catalog._data_sets["params:small"], MemoryDataSet)
+        np.testing.assert_array_equal(catalog.load("large"), data)
+
+        pattern = "Saving to a shared memory pipeline input is not allowed"
+        with pytest.raises(DataSetError, match=pattern):
+            catalog.save("large", data)
+        catalog.release("large")
+
+    def test_release_after_run(self, mocker):
+        pipeline = Pipeline(
+            [
+                node(identity, "A", "B"),
+                node(identity, "B", "C"),
+                node(identity, "B", "D"),
+            ]
+        )
+        catalog = DataCatalog({"A": MemoryDataSet(np.arange(100_000))})
+        init = mocker.spy(_SharedMemoryDataSet, "__init__")
+        ParallelRunner().run(pipeline, catalog)
+        # the blocks of the input "A" and of "B", "C" and "D"
+        names = [
+            call.args[0]._name  # pylint: disable=protected-access
+            for call in init.call_args_list
+        ]
+        assert len(names) == 4
+        for name in names:
+            with pytest.raises(FileNotFoundError):
+                parallel_runner.shared_memory.SharedMemory(name=name)
+
+    def test_release_only_remaining_after_run(self, mocker):
+        pipeline = Pipeline(
+            [
+                node(identity, "A", "B"),
+                node(identity, "B", "C"),
+                node(identity, "B", "D"),
+            ]
+        )
+        catalog = DataCatalog({"A": MemoryDataSet(np.arange(100_000))})
+        release = mocker.spy(_SharedMemoryDataSet, "_release")
+        runner = ParallelRunner()
+        runner.run(pipeline, catalog)
+        # "B" is released once both nodes loaded it, the shared input "A"
+        # and the free outputs only after the run
+        assert release.call_count == 4
+        assert runner._shared_data_sets == {}  # pylint: disable=protected-access
+
 
 @pytest.mark.skipif(
     sys.platform.startswith("win"), reason="Due to bug in parallel runner"
@@ -112,7 +401,9 @@ class TestMaxWorkers:
         ).run(fan_out_fan_in, catalog)
         assert result == {"Z": (42, 42, 42)}
 
-        executor_cls_mock.assert_called_once_with(max_workers=expected_number)
+        executor_cls_mock.assert_called_once_with(
+            max_workers=expected_number, initializer=_worker_init, initargs=mocker.ANY
+        )
 
     def test_max_worker_windows(self, mocker):
         """The ProcessPoolExecutor on Python 3.7+
@@ -141,8 +432,11 @@ class TestInvalidParallelRunner:
     def test_task_exception(self, is_async, fan_out_fan_in, catalog):
         catalog.add_feed_dict(feed_dict=dict(A=42))
         pipeline = Pipeline([fan_out_fan_in, node(exception_fn, "Z", "X")])
+        runner = ParallelRunner(is_async=is_async)
         with pytest.raises(Exception, match="test exception"):
-            ParallelRunner(is_async=is_async).run(pipeline, catalog)
+            runner.run(pipeline, catalog)
+        # the worker processes are shut down after a failed run
+        assert runner._executor is None
 
     def test_memory_dataset_output(self, is_async, fan_out_fan_in):
         """ParallelRunner does not support output to externally
@@ -203,7 +497,9 @@ class TestInvalidParallelRunner:
         real_node_deps = fan_out_fan_in.node_dependencies
         # construct deliberately unresolvable dependencies for all
         # pipeline nodes, so that none can be run
-        fake_node_deps = {k: {"you_shall_not_pass"} for k in real_node_deps}
+        fake_node_deps = MappingProxyType(
+            {k: frozenset({"you_shall_not_pass"}) for k in real_node_deps}
+        )
         # property mock requires patching a class, not an instance
         mocker.patch(
             "kedro.pipeline.Pipeline.node_dependencies",
@@ -243,13 +539,29 @@ if not sys.platform.startswith("win"):
     )
 
 
+@pytest.fixture(scope="module")
+def runners():
+    """Runners shared by the tests of the module, so that their worker
+    processes are only started once.
+    """
+    runners_ = {
+        is_async: ParallelRunner(is_async=is_async) for is_async in (False, True)
+    }
+    yield runners_
+    for runner in runners_.values():
+        runner.close()
+
+
 @pytest.mark.skipif(
     sys.platform.startswith("win"), reason="Due to bug in parallel runner"
 )
 @pytest.mark.parametrize("is_async", [False, True])
 class TestParallelRunnerRelease:
-    def test_dont_release_inputs_and_outputs(self, is_async):
-        runner = ParallelRunner(is_async=is_async)
+    @pytest.fixture
+    def runner(self, runners, is_async):
+        return runners[is_async]
+
+    def test_dont_release_inputs_and_outputs(self, runner):
         log = runner._manager.list()
 
         pipeline = Pipeline(
@@ -268,8 +580,7 @@ class TestParallelRunnerRelease:
         # we don't want to see release in or out in here
         assert list(log) == [("load", "in"), ("load", "middle"), ("release", "middle")]
 
-    def test_release_at_earliest_opportunity(self, is_async):
-        runner = ParallelRunner(is_async=is_async)
+    def test_release_at_earliest_opportunity(self, runner):
         log = runner._manager.list()
 
         pipeline = Pipeline(
@@ -296,8 +607,7 @@ class TestParallelRunnerRelease:
             ("release", "second"),
         ]
 
-    def test_count_multiple_loads(self, is_async):
-        runner = ParallelRunner(is_async=is_async)
+    def test_count_multiple_loads(self, runner):
         log = runner._manager.list()
 
         pipeline = Pipeline(
@@ -320,8 +630,7 @@ class TestParallelRunnerRelease:
             ("release", "dataset"),
         ]
 
-    def test_release_transcoded(self, is_async):
-        runner = ParallelRunner(is_async=is_async)
+    def test_release_transcoded(self, runner):
         log = runner._manager.list()
 
         pipeline = Pipeline(
@@ -340,86 +649,127 @@ class TestParallelRunnerRelease:
         assert list(log) == [("release", "save"), ("load", "load"), ("release", "load")]
 
 
-@pytest.mark.parametrize("is_async", [False, True])
-class TestRunNodeSynchronisationHelper:
-    """Test class for _run_node_synchronization helper. It is tested manually
+class TestWorkerInit:
+    """Test class for _worker_init helper. It is tested manually
     in isolation since it's called in the subprocess, which ParallelRunner
     patches have no access to.
     """
 
+    @pytest.fixture(scope="class")
+    def patches(self):
+        # The patches are only applied once for the whole class, and their
+        # mocks are reset after every test instead
+        with ExitStack() as stack:
+            yield SimpleNamespace(
+                dict_config=stack.enter_context(
+                    mock.patch("logging.config.dictConfig")
+                ),
+                configure_project=stack.enter_context(
+                    mock.patch("kedro.framework.project.configure_project")
+                ),
+                get_start_method=stack.enter_context(
+                    mock.patch("multiprocessing.get_start_method")
+                ),
+            )
+
     @pytest.fixture(autouse=True)
-    def mock_logging(self, mocker):
-        return mocker.patch("logging.config.dictConfig")
+    def reset_patches(self, patches):
+        yield
+        for patched in vars(patches).values():
+            patched.reset_mock(return_value=True)
 
-    @pytest.fixture
-    def mock_run_node(self, mocker):
-        return mocker.patch("kedro.runner.parallel_runner.run_node")
+    @pytest.mark.parametrize("conf_logging", [{"fake_logging_config": True}, {}])
+    def test_package_name_and_logging_provided(self, patches, conf_logging):
+        patches.get_start_method.return_value = "spawn"
+        package_name = mock.sentinel.package_name
 
-    @pytest.fixture
-    def mock_configure_project(self, mocker):
-        return mocker.patch("kedro.framework.project.configure_project")
+        _worker_init(package_name, conf_logging)
+        patches.dict_config.assert_called_once_with(conf_logging)
+        patches.configure_project.assert_called_once_with(package_name)
 
-    @pytest.mark.parametrize("conf_logging", [{"fake_logging_config": True}, {}])
-    def test_package_name_and_logging_provided(
-        self,
-        mock_logging,
-        mock_run_node,
-        mock_configure_project,
-        is_async,
-        conf_logging,
-        mocker,
-    ):
-        mocker.patch("multiprocessing.get_start_method", return_value="spawn")
-        node_ = mocker.sentinel.node
-        catalog = mocker.sentinel.catalog
-        session_id = "fake_session_id"
-        package_name = mocker.sentinel.package_name
+    def test_package_name_provided(self, patches):
+        patches.get_start_method.return_value = "spawn"
+        package_name = mock.sentinel.package_name
 
-        _run_node_synchronization(
-            node_,
-            catalog,
-            is_async,
-            session_id,
-            package_name=package_name,
-            conf_logging=conf_logging,
-        )
-        mock_run_node.assert_called_once()
-        mock_logging.assert_called_once_with(conf_logging)
-        mock_configure_project.assert_called_once_with(package_name)
+        _worker_init(package_name)
+        # No project-side logging.yml has been provided, so logging should not be re-configured.
+        patches.dict_config.assert_not_called()
+        patches.configure_project.assert_called_once_with(package_name)
 
-    def test_package_name_provided(
-        self,
-        mock_logging,
-        mock_run_node,
-        mock_configure_project,
-        is_async,
-        mocker,
-    ):
+    def test_package_name_not_provided(self, patches):
+        patches.get_start_method.return_value = "fork"
+        package_name = mock.sentinel.package_name
+
+        _worker_init(package_name)
+        patches.dict_config.assert_not_called()
+        patches.configure_project.assert_not_called()
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+class TestRunNodeSynchronisationHelper:
+    """Test class for _run_node_synchronization helper. It is tested manually
+    in isolation since it's called in the subprocess, which ParallelRunner
+    patches have no access to.
+    """
+
+    def test_run_node(self, is_async, mocker):
+        mock_run_node = mocker.patch("kedro.runner.parallel_runner.run_node")
+        mock_logging = mocker.patch("logging.config.dictConfig")
         mocker.patch("multiprocessing.get_start_method", return_value="spawn")
         node_ = mocker.sentinel.node
         catalog = mocker.sentinel.catalog
         session_id = "fake_session_id"
-        package_name = mocker.sentinel.package_name
 
-        _run_node_synchronization(
-            node_, catalog, is_async, session_id, package_name=package_name
+        _run_node_synchronization(node_, catalog, is_async, session_id)
+        mock_run_node.assert_called_once_with(
+            node_, catalog, mocker.ANY, is_async, session_id
         )
-        mock_run_node.assert_called_once()
-        # No project-side logging.yml has been provided, so logging should not be re-configured.
+        # The project is only configured once per worker, by _worker_init
         mock_logging.assert_not_called()
-        mock_configure_project.assert_called_once_with(package_name)
 
-    def test_package_name_not_provided(
-        self, mock_logging, mock_run_node, is_async, mocker
-    ):
-        mocker.patch("multiprocessing.get_start_method", return_value="fork")
-        node_ = mocker.sentinel.node
-        catalog = mocker.sentinel.catalog
+
+@pytest.mark.parametrize("is_async", [False, True])
+class TestRunNodeSequenceHelper:
+    """Test class for _run_node_sequence helper. It is tested manually
+    in isolation since it's called in the subprocess, which ParallelRunner
+    patches have no access to.
+    """
+
+    def test_release_after_each_node(self, is_async, mocker):
+        calls = mocker.Mock()
+        mocker.patch(
+            "kedro.runner.parallel_runner._run_node_synchronization",
+            calls.run_node,
+        )
+        catalog = mocker.Mock(release=calls.release)
+        nodes = [node(identity, "A", "B"), node(identity, "B", "C")]
         session_id = "fake_session_id"
-        package_name = mocker.sentinel.package_name
 
-        _run_node_synchronization(
-            node_, catalog, is_async, session_id, package_name=package_name
+        _run_node_sequence(
+            [pickle.dumps(n) for n in nodes],
+            catalog,
+            [["A"], ["B"]],
+            is_async,
+            session_id,
+        )
+        assert calls.mock_calls == [
+            mocker.call.run_node(nodes[0], catalog, is_async, session_id),
+            mocker.call.release("A"),
+            mocker.call.run_node(nodes[1], catalog, is_async, session_id),
+            mocker.call.release("B"),
+        ]
+
+    def test_run_node_sequences(self, is_async, mocker):
+        mock_run_sequence = mocker.patch(
+            "kedro.runner.parallel_runner._run_node_sequence"
         )
-        mock_run_node.assert_called_once()
-        mock_logging.assert_not_called()
+        sequences = [
+            ([b"first"], mocker.sentinel.first_catalog, [[]]),
+            ([b"second"], mocker.sentinel.second_catalog, [["A"]]),
+        ]
+        session_id = "fake_session_id"
+
+        _run_node_sequences(sequences, is_async, session_id)
+        assert mock_run_sequence.call_args_list == [
+            mocker.call(*sequence, is_async, session_id) for sequence in sequences
+        ]
@@ -35,6 +35,18 @@ class TestValidThreadRunner:
         assert "Z" in result
         assert result["Z"] == ("42", "42", "42")
 
+    def test_branchless_run(self, branchless_no_input_pipeline):
+        """Each node is only scheduled once the node it depends on completed."""
+        log = []
+        catalog = DataCatalog(
+            {name: LoggingDataSet(log, name) for name in ["A", "B", "C", "D"]}
+        )
+        result = ThreadRunner().run(branchless_no_input_pipeline, catalog)
+        assert isinstance(result["E"], float)
+        assert log == [
+            (action, name) for name in "ABCD" for action in ["load", "release"]
+        ]
+
 
 class TestMaxWorkers:
     @pytest.mark.parametrize(